@@ -48,7 +48,17 @@ class DatabaseEngine:
         if DatabaseEngine._engine is None:
             with DatabaseEngine._lock:
                 if DatabaseEngine._engine is None:
-                    DatabaseEngine._engine = create_engine(self.connection_string)
+                    engine_kwargs = {}
+                    if self.connection_string.startswith('mssql+pyodbc'):
+                        # Batches inserts into a single round-trip on pyodbc.
+                        engine_kwargs['fast_executemany'] = True
+                    elif self.connection_string.startswith('postgresql'):
+                        # psycopg2's default executemany loops single INSERTs;
+                        # values_plus_batch rewrites them into multi-row VALUES.
+                        engine_kwargs['executemany_mode'] = 'values_plus_batch'
+                        engine_kwargs['executemany_batch_page_size'] = 500
+                        engine_kwargs['insertmanyvalues_page_size'] = 1000
+                    DatabaseEngine._engine = create_engine(self.connection_string, **engine_kwargs)
         return DatabaseEngine._engine
 
     def create_session(self) -> Session:
@@ -61,7 +71,7 @@ class DatabaseEngine:
         return self.SessionLocal()
 
     def get_dbms_dialect(self):
-        return self.SessionLocal().bind.dialect.name
+        return self.engine.dialect.name
 
     def __enter__(self) -> Session:
         """
@@ -29,9 +29,11 @@ def partition_dataframe(
     # Create an empty list to store the partitions
     partitions = []
 
-    # Loop over the DataFrame in chunks of the specified size
+    # Loop over the DataFrame in chunks of the specified size. Rechunk each
+    # slice so every Series is one contiguous buffer; downstream writers
+    # (e.g. write_database) otherwise pay per-chunk conversion overhead.
     for i in range(0, len(df), chunk_size):
-        partitions.append(df.slice(i, chunk_size))
+        partitions.append(df.slice(i, chunk_size).rechunk())
 
     if as_dict:
         # Create a dictionary with indices as keys
@@ -1,11 +1,14 @@
+import functools
 import os
-import random
 import re
-import string
+import secrets
 from concurrent.futures import (
-    ProcessPoolExecutor,
+    FIRST_COMPLETED,
     ThreadPoolExecutor,
+    as_completed,
+    wait,
 )
+from threading import Lock
 from typing import (
     Any,
     List,
@@ -17,8 +20,8 @@ import polars as pl
 from keepitsql import (
     CopyDDl,
     FromDataframe,
-    get_table_column_info,
 )
+from loguru import logger
 from sqlalchemy import (
     Column,
     Integer,
@@ -32,13 +35,42 @@ from sqlalchemy.engine import (
     Connection,
     Engine,
 )
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import (
+    Session,
+    scoped_session,
+)
 from sqlalchemy.schema import CreateTable
 
 from keepdataflow._database_engine import DatabaseEngine
 from keepdataflow.core.create_partition import partition_dataframe
 
+# Strips IDENTITY clauses from reflected DDL; compiled once at import.
+_IDENTITY_RE = re.compile(r'IDENTITY(\(\d+,\d+\))?')
+
+# Removes square-bracket quoting in a single C-level pass.
+_BRACKETS = str.maketrans('', '', '[]')
+
+# Below this row count an upsert is cheaper as one direct statement than
+# as a temp-table round trip (kept well under dialect parameter limits).
+DIRECT_UPSERT_MAX_ROWS = 1000
+
+# Dialects with a native single-statement upsert clause.
+DIRECT_UPSERT_DIALECTS = ('postgresql', 'sqlite', 'mysql')
+
+# Dialects with an ADBC driver polars can hand Arrow batches to directly.
+ADBC_DIALECTS = ('postgresql', 'sqlite', 'snowflake')
+
+# TRUNCATE deallocates pages in one metadata operation instead of logging
+# every row; dialects without it (e.g. sqlite) fall back to DELETE.
+TRUNCATE_STATEMENTS = {
+    'mssql': 'TRUNCATE TABLE',
+    'postgresql': 'TRUNCATE TABLE',
+    'mysql': 'TRUNCATE TABLE',
+    'oracle': 'TRUNCATE TABLE',
+}
+
 
 def table_name_formattter(table_name: str, schema_name: Optional[str]) -> str:
     """
@@ -83,7 +115,7 @@ class DatabaseOperations:
 
     Attributes:
         database_engine (DatabaseEngine): The database engine instance.
-        dataframe (Optional[pl.DataFrame]): The DataFrame to hold loaded data.
+        dataframe (Optional[Union[pl.DataFrame, pl.LazyFrame]]): The frame holding loaded data.
     """
 
     def __init__(self, database_engine: DatabaseEngine) -> None:
@@ -94,7 +126,17 @@ class DatabaseOperations:
             database_engine (DatabaseEngine): The database engine instance.
         """
         self.database_engine: DatabaseEngine = database_engine
-        self.dataframe: Optional[pl.DataFrame] = None
+        self.dataframe: Optional[Union[pl.DataFrame, pl.LazyFrame]] = None
+        self._table_cache: dict[tuple, Optional[Table]] = {}
+        self._table_cache_lock: Lock = Lock()
+        self._table_metadata: MetaData = MetaData()
+        self._insert_sql_cache: dict[tuple, str] = {}
+        self._column_cache: dict[tuple, tuple] = {}
+
+    @functools.cached_property
+    def dialect(self) -> str:
+        """The database dialect name, resolved once from the engine."""
+        return self.database_engine.engine.dialect.name
 
     def generate_temp_table_name(self, table_name: str) -> str:
         """
@@ -106,10 +148,29 @@ class DatabaseOperations:
         Returns:
             str: The generated temporary table name.
         """
-        uid = "".join(random.choices(string.ascii_lowercase, k=4))
-        temp_name = f"_source_{table_name}_{uid}"
+        temp_name = f"_source_{table_name}_{secrets.token_hex(2)}"
         return temp_name
 
+    def get_table_metadata(self, session: Any, table_name: str, schema: Optional[str] = None) -> tuple:
+        """
+        Fetch column and primary-key metadata for a table, caching the result.
+
+        Args:
+            session (Any): The database session.
+            table_name (str): The name of the table.
+            schema (Optional[str]): The schema of the table.
+
+        Returns:
+            tuple: The (columns_info, pk_info) inspector results.
+        """
+        key = (self.dialect, schema, table_name)
+        if key not in self._column_cache:
+            inspector = inspect(session.bind)
+            columns_info = inspector.get_columns(table_name, schema=schema)
+            pk_info = inspector.get_pk_constraint(table_name, schema=schema)
+            self._column_cache[key] = (columns_info, pk_info)
+        return self._column_cache[key]
+
     def create_temp_table(
         self,
         session: Any,
@@ -123,9 +184,7 @@ class DatabaseOperations:
         """
         metadata = MetaData()
         with session:
-            inspector = inspect(session.bind)
-            columns_info = inspector.get_columns(table_name, schema=source_schema)
-            pk_info = inspector.get_pk_constraint(table_name, schema=source_schema)
+            columns_info, pk_info = self.get_table_metadata(session, table_name, schema=source_schema)
 
             # Define the table object with columns and primary key
             columns = []
@@ -155,18 +214,42 @@ class DatabaseOperations:
                 "bigquery": "",  # BigQuery specific statement not provided
             }
             # Generate the DDL
-            dbms_dialect = session.bind.dialect.name
-            temp_table_header = create_temp_table_headers.get(dbms_dialect)
+            temp_table_header = create_temp_table_headers.get(self.dialect)
 
             ddl = str(CreateTable(table).compile(session.bind)).replace('"', '')
-            temp_ddl = (
-                ddl.replace("CREATE TABLE ", temp_table_header).replace(']', '').replace('[', '')
+            temp_ddl = _IDENTITY_RE.sub(
+                '', ddl.replace("CREATE TABLE ", temp_table_header).translate(_BRACKETS)
             )  # spacing is important for sql server
-            pattern = r'IDENTITY(\(\d+,\d+\))?'
-            temp_ddl = re.sub(pattern, '', temp_ddl)
 
             return str(temp_ddl)
 
+    def reflect_table(self, session: Any, table_name: str, schema: Optional[str] = None) -> Optional[Table]:
+        """
+        Reflect a table from the database, caching the result per target.
+
+        Args:
+            session (Any): The database session.
+            table_name (str): The name of the table to reflect.
+            schema (Optional[str]): The schema of the table.
+
+        Returns:
+            Optional[Table]: The reflected Table, or None if reflection failed
+            (e.g. for session-scoped temporary tables).
+        """
+        key = (table_name, schema)
+        # Lock the check-then-populate: worker threads racing to reflect the
+        # same target would otherwise collide on the shared MetaData, and the
+        # loser's InvalidRequestError would be cached as "unreflectable".
+        with self._table_cache_lock:
+            if key not in self._table_cache:
+                try:
+                    self._table_cache[key] = Table(
+                        table_name, self._table_metadata, schema=schema, autoload_with=session.bind
+                    )
+                except SQLAlchemyError:
+                    self._table_cache[key] = None
+            return self._table_cache[key]
+
     def insert_data_partition(
         self,
         partition: pl.DataFrame,
@@ -176,16 +259,30 @@ class DatabaseOperations:
         source_table: Optional[str] = None,
     ) -> None:
         try:
-            params_list = [dict(row) for row in partition.iter_rows(named=True)]
-            insert_conn = FromDataframe(dataframe=partition)
+            params_list = partition.to_dicts()
+            table = self.reflect_table(session, target_table, schema=target_schema)
 
-            tbl_name = table_name_formattter(target_table, target_schema)
-            insert_sql = insert_conn.insert(table_name=tbl_name, source_table=source_table)
-
-            session.execute(text(insert_sql), params_list)
-
-        except Exception as e:
-            print(f"An error occurred: {e}")
+            if table is not None:
+                # SQLAlchemy Core insert with a list of rows hits the
+                # driver's native executemany fast path.
+                session.execute(table.insert(), params_list)
+            else:
+                # The template only depends on the target and column set, so
+                # build it for the first partition and reuse it for the rest.
+                key = (target_table, target_schema, source_table)
+                insert_sql = self._insert_sql_cache.get(key)
+                if insert_sql is None:
+                    insert_conn = FromDataframe(dataframe=partition)
+                    tbl_name = table_name_formattter(target_table, target_schema)
+                    insert_sql = insert_conn.insert(table_name=tbl_name, source_table=source_table)
+                    self._insert_sql_cache[key] = insert_sql
+                session.execute(text(insert_sql), params_list)
+
+        except Exception:
+            # Propagate so the caller can roll back; a swallowed partition
+            # would otherwise silently vanish from the load.
+            logger.exception("Insert into {} failed", table_name_formattter(target_table, target_schema))
+            raise
 
     def upsert_data_partition(
         self,
@@ -207,19 +304,115 @@ class DatabaseOperations:
             source_table_name=source_table,
         )
 
+        # No commit here: the caller owns the transaction so the temp-table
+        # load, merge, and cleanup land in a single commit.
         session.execute(text(merge_sql))
-        session.commit()
+
+    def upsert_data_direct(
+        self,
+        session: Any,
+        table_name: str,
+        dbms: str,
+        match_condition: List[str],
+        constraint_columns: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Upsert the loaded DataFrame in a single statement, without a temp table.
+
+        Args:
+            session (Any): The database session.
+            table_name (str): The formatted target table name.
+            dbms (str): The dialect name; must be in DIRECT_UPSERT_DIALECTS.
+            match_condition (List[str]): The key columns to match rows on.
+            constraint_columns (Optional[List[str]]): Columns excluded from
+                the update set (e.g. identity columns).
+        """
+        if self.dataframe.is_empty():
+            # Nothing to bind; executing with an empty parameter list would
+            # raise rather than no-op like the temp-table path.
+            return
+
+        columns = self.dataframe.columns
+        skip_columns = set(match_condition) | set(constraint_columns or [])
+        update_columns = [col for col in columns if col not in skip_columns]
+
+        insert_list = ", ".join(columns)
+        placeholder_list = ", ".join(f":{col}" for col in columns)
+
+        if dbms == 'mysql':
+            if update_columns:
+                set_clause = ", ".join(f"{col} = VALUES({col})" for col in update_columns)
+            else:
+                # Every column is a key; self-assign one so a duplicate row
+                # is a no-op instead of a syntax error.
+                set_clause = f"{match_condition[0]} = {match_condition[0]}"
+            upsert_sql = (
+                f"INSERT INTO {table_name} ({insert_list}) VALUES ({placeholder_list}) "
+                f"ON DUPLICATE KEY UPDATE {set_clause}"
+            )
+        else:
+            conflict_list = ", ".join(match_condition)
+            if update_columns:
+                set_clause = ", ".join(f"{col} = excluded.{col}" for col in update_columns)
+                conflict_action = f"DO UPDATE SET {set_clause}"
+            else:
+                conflict_action = "DO NOTHING"
+            upsert_sql = (
+                f"INSERT INTO {table_name} ({insert_list}) VALUES ({placeholder_list}) "
+                f"ON CONFLICT ({conflict_list}) {conflict_action}"
+            )
+
+        session.execute(text(upsert_sql), self.dataframe.to_dicts())
 
     def truncate_table(self, target_table: str, target_schema: Optional[str] = None) -> None:
         with self.database_engine as session:
-            truncate_text = text(f'DELETE FROM {target_table}')
-            session.execute(truncate_text)
+            preparer = session.bind.dialect.identifier_preparer
+            qualified_name = preparer.quote(target_table)
+            if target_schema:
+                qualified_name = f"{preparer.quote_schema(target_schema)}.{qualified_name}"
+
+            statement = TRUNCATE_STATEMENTS.get(self.dialect, 'DELETE FROM')
+            session.execute(text(f'{statement} {qualified_name}'))
             session.commit()
 
-    def load_dataframe(self, dataframe: pl.DataFrame) -> 'DatabaseOperations':
+    def load_dataframe(self, dataframe: Union[pl.DataFrame, pl.LazyFrame]) -> 'DatabaseOperations':
         self.dataframe = dataframe
         return self
 
+    def _materialize_dataframe(self) -> pl.DataFrame:
+        """
+        Collect the loaded frame if it is lazy, caching the result.
+
+        Returns:
+            pl.DataFrame: The materialized DataFrame.
+        """
+        if isinstance(self.dataframe, pl.LazyFrame):
+            self.dataframe = self.dataframe.collect(streaming=True)
+        return self.dataframe
+
+    def _iter_partitions(self, chunk_size: int, column_name: Optional[str] = None) -> Any:
+        """
+        Yield partitions of the loaded frame one chunk at a time.
+
+        Lazy frames are collected with the streaming engine first; chunked
+        partitions are then yielded as contiguous slices so only the chunks
+        currently held by workers stay resident.
+
+        Args:
+            chunk_size (int): The size of each chunk.
+            column_name (Optional[str]): The column to partition by, if any.
+
+        Yields:
+            pl.DataFrame: The next partition.
+        """
+        frame = self._materialize_dataframe()
+
+        if column_name is not None and column_name in frame.columns:
+            yield from frame.partition_by(column_name, as_dict=False)
+        else:
+            for part in frame.iter_slices(chunk_size):
+                yield part.rechunk()
+
     def copy_source_db(
         self,
         source_db_url: str,
@@ -292,6 +485,7 @@ class DatabaseOperations:
         partition_by: Optional[Union[str, List[str]]] = None,
         full_refresh: str = 'N',
         chunk_size: int = 5000,
+        max_workers: Optional[int] = None,
         **kwargs,
     ) -> None:
         """
@@ -304,6 +498,9 @@ class DatabaseOperations:
             partition_by (Optional[Union[str, List[str]]]): The column(s) to partition by.
             full_refresh (str): Whether to perform a full refresh. Default is 'N'.
             chunk_size (int): The size of each chunk. Default is 5000.
+            max_workers (Optional[int]): The number of insert worker threads.
+                Defaults to min(8, cpu count); the database is usually the
+                bottleneck, so more workers only add thread churn.
         """
         if self.dataframe is None:
             raise ValueError("No DataFrame loaded.")
@@ -311,20 +508,95 @@ class DatabaseOperations:
         if isinstance(partition_by, list):
             partition_by = partition_by[0]
 
-        partition = partition_dataframe(self.dataframe, chunk_size=chunk_size, column_name=partition_by)
+        partition = self._iter_partitions(chunk_size=chunk_size, column_name=partition_by)
+
+        qualified_name = table_name_formattter(target_table, target_schema)
 
         if full_refresh == 'Y':
-            self.truncate_table(table_name_formattter(target_table, target_schema))
+            self.truncate_table(target_table, target_schema)
 
-        def insert_partition_with_session(part: pl.DataFrame) -> None:
+        # Arrow-native bulk path: when writing straight to the target table
+        # (no caller-managed session), hand the Arrow buffers to an ADBC
+        # driver in one call instead of converting rows to dicts.
+        if session is None and self.dialect in ADBC_DIALECTS:
             try:
+                url = self.database_engine.engine.url.render_as_string(hide_password=False)
+                self._materialize_dataframe().write_database(
+                    table_name=qualified_name,
+                    connection=url,
+                    engine="adbc",
+                    if_table_exists="append",
+                )
+                return
+            except ModuleNotFoundError:
+                # No ADBC driver installed; fall back to executemany.
+                pass
+
+        if max_workers is None:
+            max_workers = min(8, (os.cpu_count() or 2))
+
+        if session is not None:
+            # A single Session/connection does not support concurrent
+            # execute() calls, and the session-scoped temp tables this path
+            # targets cannot be written from other connections anyway, so
+            # partitions are serialized on the caller's session.
+            max_workers = 1
+        elif self.dialect == 'sqlite':
+            # SQLite permits one writer at a time: a worker's open
+            # transaction holds the RESERVED lock and every other worker's
+            # INSERT blocks on it until the busy timeout, so concurrent
+            # worker sessions deadlock the load. Serialize instead.
+            max_workers = 1
+
+        # When no session is supplied, give each worker thread one
+        # thread-local session so every partition it handles reuses the
+        # same connection instead of opening a new one per chunk.
+        ScopedSession = scoped_session(self.database_engine.SessionLocal) if session is None else None
+        thread_sessions: List[Session] = []
+        sessions_lock = Lock()
+
+        def insert_partition_with_session(part: pl.DataFrame) -> None:
+            if ScopedSession is not None:
+                db_session = ScopedSession()
+                with sessions_lock:
+                    if db_session not in thread_sessions:
+                        thread_sessions.append(db_session)
+            else:
                 db_session = session
-                self.insert_data_partition(part, db_session, target_table, target_schema)
-            except Exception as e:
-                print(f"An error occurred in insert_partition_with_session: {e}")
+            self.insert_data_partition(part, db_session, target_table, target_schema)
 
-        with ThreadPoolExecutor() as executor:
-            executor.map(insert_partition_with_session, partition)
+        try:
+            # Partition inserts are I/O-bound (network round-trips plus remote
+            # commit), so threads are the right executor here; processes would
+            # add ~20 MB per worker for no throughput gain.
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Bounded submission window: keep a couple of partitions in
+                # flight per worker so slicing the next chunk overlaps with
+                # the inserts already executing, instead of draining the
+                # whole partition generator into memory up front.
+                in_flight: set = set()
+                window = max_workers * 2
+                for part in partition:
+                    if len(in_flight) >= window:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    in_flight.add(executor.submit(insert_partition_with_session, part))
+                for future in as_completed(in_flight):
+                    # Re-raise so a failed partition aborts the insert instead
+                    # of being silently dropped.
+                    future.result()
+            if ScopedSession is not None:
+                # Commit once per worker session rather than per partition.
+                for db_session in thread_sessions:
+                    db_session.commit()
+        except Exception:
+            for db_session in thread_sessions:
+                db_session.rollback()
+            raise
+        finally:
+            for db_session in thread_sessions:
+                db_session.close()
 
     def db_merge(
         self,
@@ -336,12 +608,39 @@ class DatabaseOperations:
         chunk_size: int = 5000,
         **kwargs,
     ) -> None:
+        self._materialize_dataframe()
+        qualified_name = table_name_formattter(target_table, target_schema)
         with self.database_engine as session:
-            auto_columns, primary_key_list = get_table_column_info(session, target_table, target_schema)
-            partition = partition_dataframe(self.dataframe, chunk_size=chunk_size, column_name=partition_by)
+            # One catalog fetch covers both the merge metadata and the
+            # temp-table DDL built from the same cache in create_temp_table.
+            columns_info, pk_info = self.get_table_metadata(session, target_table, schema=target_schema)
+            auto_columns = [
+                col['name'] for col in columns_info if col.get('autoincrement') is True or col.get('identity')
+            ]
+            primary_key_list = pk_info.get('constrained_columns') or []
             constraint_list = auto_columns if constraint_columns is None else constraint_columns
             match_list = primary_key_list if match_condition is None else match_condition
-            dbms = self.database_engine.get_dbms_dialect()
+            dbms = self.dialect
+
+            # Small frames: a single direct upsert statement beats the
+            # temp-table round trip on dialects with a native upsert clause.
+            # Only when matching on the primary key, though: ON CONFLICT /
+            # ON DUPLICATE KEY need a unique constraint behind the match
+            # columns, while the temp-table MERGE takes arbitrary ones.
+            if (
+                len(self.dataframe) <= DIRECT_UPSERT_MAX_ROWS
+                and dbms in DIRECT_UPSERT_DIALECTS
+                and match_list
+                and set(match_list) == set(primary_key_list)
+            ):
+                self.upsert_data_direct(
+                    session,
+                    qualified_name,
+                    dbms,
+                    match_list,
+                    constraint_columns=constraint_list,
+                )
+                return
 
             # Step 1: Create temp table
             gen_temp_table_name = self.generate_temp_table_name(target_table)
@@ -354,14 +653,13 @@ class DatabaseOperations:
             # format for mssql
             gen_temp_table_name = f'##{gen_temp_table_name}' if dbms == 'mssql' else gen_temp_table_name
             # Step 2: Insert into temp table
-            print(f"Begin {gen_temp_table_name} insert")
+            logger.info("Begin {} insert", gen_temp_table_name)
             self.db_insert(
                 session=session, target_table=gen_temp_table_name, partition_by=partition_by, chunk_size=chunk_size
             )
             # Step 3: Load Temp table into Target Table
             params = {
-                'table_name': table_name_formattter(target_table, target_schema),
-                'partition': partition,  # replace with partiont parameter
+                'table_name': qualified_name,
                 'match_condition': match_list,
                 'constraint_columns': constraint_list,
                 'dbms': dbms,
@@ -369,6 +667,11 @@ class DatabaseOperations:
             }
             self.upsert_data_partition(session=session, **params)
 
+            # Step 4: Drop the temp table. The engine context commits the
+            # whole create/insert/merge/drop sequence once on exit, so the
+            # merge costs a single fsync instead of one per step.
+            session.execute(text(f"DROP TABLE {gen_temp_table_name}"))
+
     def db_merge_with_polars(
         self,
         target_table: str,
@@ -379,12 +682,20 @@ class DatabaseOperations:
         chunk_size: int = 5000,
         **kwargs,
     ) -> None:
+        self._materialize_dataframe()
+        qualified_name = table_name_formattter(target_table, target_schema)
         with self.database_engine as session:
-            auto_columns, primary_key_list = get_table_column_info(session, target_table, target_schema)
+            # One catalog fetch covers both the merge metadata and the
+            # temp-table DDL built from the same cache in create_temp_table.
+            columns_info, pk_info = self.get_table_metadata(session, target_table, schema=target_schema)
+            auto_columns = [
+                col['name'] for col in columns_info if col.get('autoincrement') is True or col.get('identity')
+            ]
+            primary_key_list = pk_info.get('constrained_columns') or []
             partition = partition_dataframe(self.dataframe, chunk_size=chunk_size, column_name=partition_by)
             constraint_list = auto_columns if constraint_columns is None else constraint_columns
             match_list = primary_key_list if match_condition is None else match_condition
-            dbms = self.database_engine.get_dbms_dialect()
+            dbms = self.dialect
 
             # Step 1: Create temp table
             gen_temp_table_name = self.generate_temp_table_name(target_table)
@@ -397,9 +708,17 @@ class DatabaseOperations:
             # format for mssql
             gen_temp_table_name = f'##{gen_temp_table_name}' if dbms == 'mssql' else gen_temp_table_name
             # Step 2: Insert into temp table
-            print(f"Begin {gen_temp_table_name} insert")
+            logger.info("Begin {} insert", gen_temp_table_name)
+            # Write over the session's own connection: the temp table is
+            # session-scoped, so a separate pooled connection (what polars
+            # checks out when handed an Engine, and what the ADBC engine
+            # would open) cannot see it. This also keeps the writes inside
+            # the surrounding transaction.
+            session_connection = session.connection()
             for p in partition:
-                p.write_database(table_name=gen_temp_table_name, connection=session.bind, if_table_exists="append")
+                p.write_database(
+                    table_name=gen_temp_table_name, connection=session_connection, if_table_exists="append"
+                )
 
             # self.db_insert(
             #     session=session, target_table=gen_temp_table_name, partition_by=partition_by, chunk_size=chunk_size
@@ -407,7 +726,7 @@ class DatabaseOperations:
 
             # Step 3: Load Temp table into Target Table
             params = {
-                'table_name': table_name_formattter(target_table, target_schema),
+                'table_name': qualified_name,
                 'partition': partition,  # replace with partiont parameter
                 'match_condition': match_list,
                 'constraint_columns': constraint_list,
@@ -415,3 +734,8 @@ class DatabaseOperations:
                 'source_table': gen_temp_table_name,
             }
             self.upsert_data_partition(session=session, **params)
+
+            # Step 4: Drop the temp table. The engine context commits the
+            # whole create/insert/merge/drop sequence once on exit, so the
+            # merge costs a single fsync instead of one per step.
+            session.execute(text(f"DROP TABLE {gen_temp_table_name}"))
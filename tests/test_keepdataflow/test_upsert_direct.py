@@ -0,0 +1,57 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import polars as pl
+from sqlalchemy import text
+
+from keepdataflow._database_engine import DatabaseEngine
+from keepdataflow.database_operations import DatabaseOperations
+
+
+class TestUpsertDataDirect(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = Path(self.tmpdir.name) / "test.db"
+        DatabaseEngine._engine = None  # reset the singleton so each test gets its own database
+        self.engine = DatabaseEngine(f"sqlite:///{db_path}")
+        self.operations = DatabaseOperations(self.engine)
+        with self.engine as session:
+            session.execute(text("CREATE TABLE items (ItemID TEXT PRIMARY KEY, Quantity INTEGER)"))
+            session.execute(text("INSERT INTO items VALUES ('A', 1), ('B', 2)"))
+
+    def tearDown(self) -> None:
+        self.engine.engine.dispose()
+        DatabaseEngine._engine = None
+        self.tmpdir.cleanup()
+
+    def fetch_items(self) -> dict:
+        with self.engine as session:
+            return dict(session.execute(text("SELECT ItemID, Quantity FROM items")).fetchall())
+
+    def test_upsert_updates_matches_and_inserts_new_rows(self) -> None:
+        df = pl.DataFrame({"ItemID": ["A", "C"], "Quantity": [10, 30]})
+        self.operations.load_dataframe(df)
+        with self.engine as session:
+            self.operations.upsert_data_direct(session, "items", "sqlite", ["ItemID"])
+        self.assertEqual(self.fetch_items(), {"A": 10, "B": 2, "C": 30})
+
+    def test_empty_frame_is_a_no_op(self) -> None:
+        df = pl.DataFrame({"ItemID": [], "Quantity": []})
+        self.operations.load_dataframe(df)
+        with self.engine as session:
+            self.operations.upsert_data_direct(session, "items", "sqlite", ["ItemID"])
+        self.assertEqual(self.fetch_items(), {"A": 1, "B": 2})
+
+    def test_keys_only_frame_inserts_without_updating(self) -> None:
+        # Every column is a match column, so there is nothing to update on
+        # conflict; existing rows must be left untouched.
+        df = pl.DataFrame({"ItemID": ["A", "C"]})
+        self.operations.load_dataframe(df)
+        with self.engine as session:
+            self.operations.upsert_data_direct(session, "items", "sqlite", ["ItemID"])
+        self.assertEqual(self.fetch_items(), {"A": 1, "B": 2, "C": None})
+
+
+if __name__ == '__main__':
+    unittest.main()